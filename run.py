@@ -2,6 +2,7 @@
 """Run script for the Talking Drone application."""
 
 import argparse
+import importlib.util
 import os
 import sys
 from pathlib import Path
@@ -13,6 +14,13 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 
+def _get_loop() -> str:
+    """Use uvloop where it is installed; uvicorn's default loop otherwise."""
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        return "uvloop"
+    return "auto"
+
+
 def main():
     """Main entry point for running the application."""
     parser = argparse.ArgumentParser(description="Run the Talking Drone API server")
@@ -34,9 +42,19 @@ def main():
     )
     parser.add_argument(
         "--log-level",
-        default="debug",
+        default="warning",
         choices=["debug", "info", "warning", "error", "critical"],
-        help="Log level (default: debug)",
+        help="Log level (default: warning)",
+    )
+    parser.add_argument(
+        "--access-log",
+        action="store_true",
+        help="Enable uvicorn access logging (disabled by default)",
+    )
+    parser.add_argument(
+        "--proxy-headers",
+        action="store_true",
+        help="Trust X-Forwarded-* proxy headers (disabled by default)",
     )
 
     args = parser.parse_args()
@@ -58,6 +76,7 @@ def main():
     print(f"🔄 Reload: {reload_mode}")
     print(f"🐛 Debug: {debug_mode}")
     print(f"📊 Log Level: {args.log_level}")
+    print(f"📝 Access Log: {args.access_log}")
     print(f"📁 Project Root: {project_root}")
     print(f"🔗 Access your app at: http://localhost:{args.port}")
     print(f"📚 API Documentation: http://localhost:{args.port}/docs")
@@ -71,7 +90,10 @@ def main():
             reload=reload_mode,
             factory=True,
             log_level=args.log_level,
-            access_log=True,
+            access_log=args.access_log,
+            proxy_headers=args.proxy_headers,
+            loop=_get_loop(),
+            http="httptools",
         )
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
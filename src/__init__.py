@@ -1,116 +1,120 @@
 """The FastAPI application for the Talking Drone."""
 
-import time
-import traceback
+import importlib.util
+import logging
+import sys
 
 import typer
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from src.config.settings import Settings
+from src.config.settings import get_settings
 from src.controller.autopilot import router as autopilot_router
 from src.controller.drone import router as drone_router
 from src.controller.environment import router as environment_router
-from src.controller.environment import set_environment_instance
 from src.services.environment import EnvironmentService
 from src.utils.logger import log_endpoint_error, logger
+from src.utils.middleware import TimingLogMiddleware
 from src.utils.simulation_monitor import get_simulation_monitor
 
 
+def _get_endpoint(request: Request) -> str:
+    """Return the endpoint string cached by the timing middleware."""
+    endpoint = getattr(request.state, "endpoint", None)
+    if endpoint is None:
+        endpoint = f"{request.method} {request.url.path}"
+    return endpoint
+
+
+async def _http_exception_handler(request: Request, exc: HTTPException):
+    """Log HTTP exceptions; these are expected, so no stack trace is recorded."""
+    endpoint = _get_endpoint(request)
+    logger.warning("HTTP %d on %s: %s", exc.status_code, endpoint, exc.detail)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Request details for %s: %s",
+            endpoint,
+            {
+                "headers": dict(request.headers),
+                "path_params": request.path_params,
+                "query_params": dict(request.query_params)
+                if request.query_params
+                else None,
+            },
+        )
+    return ORJSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
+
+
+async def _validation_exception_handler(
+    request: Request, exc: RequestValidationError
+):
+    """Log validation errors with details."""
+    endpoint = _get_endpoint(request)
+    detail = {"errors": exc.errors(), "body": exc.body}
+    # Request headers are only worth copying when DEBUG records are emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        detail["headers"] = dict(request.headers)
+    log_endpoint_error(error=exc, endpoint=endpoint, detail=detail)
+    return ORJSONResponse(status_code=422, content={"detail": exc.errors()})
+
+
+async def _global_exception_handler(request: Request, exc: Exception):
+    """Log unhandled exceptions from the application."""
+    endpoint = _get_endpoint(request)
+
+    # The traceback is formatted by the log handler, only if the record is emitted
+    logger.error("UNHANDLED EXCEPTION: %s", endpoint, exc_info=exc)
+
+    # Return a generic error message to the client
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "detail": "An unexpected error occurred. Please check the logs for details."
+        },
+    )
+
+
+def _read_root():
+    """Describe the application and where to find its docs and visualization."""
+    return {
+        "app_name": get_settings().app_name,
+        "version": "0.1.0",
+        "api_docs": "/docs",
+        "visualization": "/viz",
+    }
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    settings = get_settings()
     app = FastAPI(
-        title=Settings.app_name,
+        title=settings.app_name,
         description="API for the Talking Drone simulation",
         version="0.1.0",
-        debug=Settings.debug,
+        debug=settings.debug,
+        default_response_class=ORJSONResponse,
     )
 
-    # Add request logging middleware
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        """Log information about API requests."""
-        # Get request details
-        endpoint = f"{request.method} {request.url.path}"
-        start_time = time.time()
+    # Debug mode also enables DEBUG log records
+    if settings.debug:
+        logger.setLevel(logging.DEBUG)
 
-        # Skip logging for /environment/state endpoint to reduce noise
-        should_log = not (
-            request.method == "GET" and request.url.path == "/environment/state/"
-        )
+    # Compress responses of 1 KiB or more (registered first so it sits inside
+    # the timing middleware and its cost is measured)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-        # Log the request only if not filtered
-        if should_log:
-            logger.info(f"REQUEST: {endpoint}")
-
-        # Process the request
-        response = await call_next(request)
-
-        # Calculate processing time
-        process_time = time.time() - start_time
-
-        # Log response information only if not filtered
-        if should_log:
-            logger.info(
-                f"RESPONSE: {endpoint} - Status {response.status_code} - Took {process_time:.3f}s"
-            )
-
-        return response
+    # Add request logging middleware
+    app.add_middleware(TimingLogMiddleware)
 
     # Add exception handlers for logging errors
-    @app.exception_handler(HTTPException)
-    async def http_exception_handler(request: Request, exc: HTTPException):
-        """Log HTTP exceptions with details."""
-        endpoint = f"{request.method} {request.url.path}"
-        detail = {
-            "status_code": exc.status_code,
-            "headers": dict(request.headers),
-            "path_params": request.path_params,
-            "query_params": dict(request.query_params)
-            if request.query_params
-            else None,
-        }
-        log_endpoint_error(error=exc, endpoint=endpoint, detail=detail)
-        return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
-
-    @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(
-        request: Request, exc: RequestValidationError
-    ):
-        """Log validation errors with details."""
-        endpoint = f"{request.method} {request.url.path}"
-        detail = {
-            "errors": exc.errors(),
-            "body": exc.body,
-            "headers": dict(request.headers),
-        }
-        log_endpoint_error(error=exc, endpoint=endpoint, detail=detail)
-        return JSONResponse(status_code=422, content={"detail": exc.errors()})
-
-    @app.exception_handler(Exception)
-    async def global_exception_handler(request: Request, exc: Exception):
-        """Log unhandled exceptions from the application."""
-        endpoint = f"{request.method} {request.url.path}"
-        error_msg = f"\n--- UNHANDLED EXCEPTION: {endpoint} ---\n"
-        error_msg += f"Exception Type: {type(exc).__name__}\n"
-        error_msg += f"Exception Message: {str(exc)}\n"
-        error_msg += f"Stack Trace:\n{traceback.format_exc()}\n"
-        error_msg += "-----------------------------------"
-
-        # Log the error with high visibility
-        logger.error(error_msg)
-
-        # Return a generic error message to the client
-        return JSONResponse(
-            status_code=500,
-            content={
-                "detail": "An unexpected error occurred. Please check the logs for details."
-            },
-        )
+    app.add_exception_handler(HTTPException, _http_exception_handler)
+    app.add_exception_handler(RequestValidationError, _validation_exception_handler)
+    app.add_exception_handler(Exception, _global_exception_handler)
 
     # Add CORS middleware
     app.add_middleware(
@@ -124,12 +128,15 @@ def create_app() -> FastAPI:
     # Create a global environment instance
     environment = EnvironmentService()
 
-    # Start the simulation monitor to log simulation time every 10 seconds
-    simulation_monitor = get_simulation_monitor(environment)
-    simulation_monitor.start()
+    # Start the simulation monitor to log simulation time periodically
+    if settings.simulation_monitor_interval > 0:
+        simulation_monitor = get_simulation_monitor(
+            environment, settings.simulation_monitor_interval
+        )
+        simulation_monitor.start()
 
     # Set the environment instance for the API
-    set_environment_instance(environment)
+    app.state.environment = environment
 
     # Include router for drone endpoints
     app.include_router(drone_router)
@@ -144,14 +151,7 @@ def create_app() -> FastAPI:
     app.mount("/viz", StaticFiles(directory="static", html=True), name="viz")
 
     # Add root endpoint
-    @app.get("/")
-    def read_root():
-        return {
-            "app_name": Settings.app_name,
-            "version": "0.1.0",
-            "api_docs": "/docs",
-            "visualization": "/viz",
-        }
+    app.add_api_route("/", _read_root, methods=["GET"])
 
     return app
 
@@ -159,11 +159,21 @@ def create_app() -> FastAPI:
 app = typer.Typer()
 
 
+def _get_loop() -> str:
+    """Use uvloop where it is installed; uvicorn's default loop otherwise."""
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        return "uvloop"
+    return "auto"
+
+
 @app.command()
 def serve(
     host: str = "0.0.0.0",
     port: int = 8000,
     reload: bool = False,
+    log_level: str = "warning",
+    access_log: bool = False,
+    proxy_headers: bool = False,
 ):
     """Run the API server."""
     uvicorn.run(
@@ -172,7 +182,12 @@ def serve(
         port=port,
         reload=reload,
         factory=True,
-        access_log=False,  # Disable uvicorn access logging to prevent /environment/state noise
+        loop=_get_loop(),
+        http="httptools",
+        log_level=log_level,
+        # Disabled by default to prevent /environment/state noise
+        access_log=access_log,
+        proxy_headers=proxy_headers,
     )
 
 
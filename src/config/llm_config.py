@@ -0,0 +1,22 @@
+"""
+LLM client configuration for the autopilot agent.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from langchain.chat_models import init_chat_model
+
+from src.constant.keys import GOOGLE_API_KEY
+
+
+@lru_cache(maxsize=4)
+def get_llm_object(model_name: str) -> Any:
+    """Get the chat model client for a model, creating it on first use."""
+    return init_chat_model(
+        model=model_name,
+        max_tokens=128000,
+        max_retries=3,
+        temperature=0.2,
+        google_api_key=GOOGLE_API_KEY,
+    )
@@ -1,11 +1,21 @@
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.models.physical_models import BuildingInformation, Location
 
 
-class Settings:
+class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_prefix="TALKINGDRONE_",
+        extra="ignore",
+    )
+
     # App settings
     app_name: str = "The Talking Drone"
     debug: bool = False
@@ -40,22 +50,26 @@ class Settings:
         ),
     ]
 
+    # Simulation monitor logging interval in seconds (0 disables the monitor)
+    simulation_monitor_interval: int = 10
+
     # Default drone model settings
     default_drone_max_speed: float = 0.20
     default_drone_max_vertical_speed: float = 0.20
     default_drone_max_yaw_rate: float = 9
     default_drone_max_altitude: float = 0.75
     default_drone_weight: float = 0.100
-    default_drone_dimensions: tuple = (0.10, 0.10, 0.02)
+    default_drone_dimensions: Tuple[float, float, float] = (0.10, 0.10, 0.02)
     default_drone_fuel_capacity: float = 100.0
     default_drone_fuel_consumption_rate: float = 1.0
 
     # LangChain settings
     langchain_model: str = "google_genai:gemini-2.5-flash"
+    # Cheaper model for single-step commands such as "land"; None disables routing
+    langchain_light_model: Optional[str] = "google_genai:gemini-2.5-flash-lite"
 
-    class Config:
-        """Pydantic config"""
 
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        env_prefix = "TALKINGDRONE_"
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, created once and shared afterwards."""
+    return Settings()
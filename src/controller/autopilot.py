@@ -1,6 +1,7 @@
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from src.controller.drone import get_drone_service
@@ -32,53 +33,109 @@ class TurnRequest(BaseModel):
     angle: float
 
 
-def get_autopilot_service(drone_id: str) -> AutoPilotService:
-    from src.controller.environment import get_environment_instance
-
-    environment = get_environment_instance()
-    if drone_id not in environment.autopilot_agents:
+async def get_autopilot_service(
+    drone_id: str,
+    environment: EnvironmentService = Depends(get_environment_instance),
+) -> AutoPilotService:
+    """Dependency to get the autopilot service of a drone by ID."""
+    autopilot_service = environment.autopilot_agents.get(drone_id)
+    if autopilot_service is None:
         raise HTTPException(
             status_code=404, detail=f"No autopilot agent found for drone {drone_id}"
         )
-    return environment.autopilot_agents[drone_id]
+    return autopilot_service
 
 
 @router.post("/{drone_id}/command/")
-def execute_command(
+async def execute_command(
     command_input: CommandInput,
     drone_id: str,
     environment: EnvironmentService = Depends(get_environment_instance),
 ):
     """Execute a natural language command via the autopilot agent."""
-    if drone_id not in environment.autopilot_agents:
+    agent = environment.autopilot_agents.get(drone_id)
+    if agent is None:
         raise HTTPException(
             status_code=404, detail=f"No autopilot agent found for drone {drone_id}"
         )
-    agent = environment.autopilot_agents[drone_id]
     try:
-        agent.execute_command(command_input.command)
+        await agent.submit_command(command_input.command)
     except AgentNotInitializedException:
-        logger.error(f"Autopilot agent for drone {drone_id} not initialized")
+        logger.error("Autopilot agent for drone %s not initialized", drone_id)
         raise HTTPException(
             status_code=400,
             detail="Autopilot agent not initialized. Initialize it first.",
         )
     except AutopilotException as e:
         logger.error(
-            f"Autopilot error for drone {drone_id}: {str(e)} - Command: {command_input.command}"
+            "Autopilot error for drone %s: %s - Command: %s",
+            drone_id,
+            e,
+            command_input.command,
         )
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(
-            f"Unexpected error executing command for drone {drone_id}: {str(e)} - Command: {command_input.command}"
+            "Unexpected error executing command for drone %s: %s - Command: %s",
+            drone_id,
+            e,
+            command_input.command,
         )
         raise HTTPException(
             status_code=500, detail=f"Error executing command: {str(e)}"
         )
 
 
+def _format_event(data: str, event: Optional[str] = None) -> str:
+    """Frame text as a server-sent event, one data line per line of text."""
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+async def _stream_reply(
+    autopilot_service: AutoPilotService, command: str
+) -> AsyncIterator[str]:
+    """
+    Stream the agent's reply to a command as server-sent events.
+
+    The response status is already sent once streaming starts, so a failing
+    command ends the stream with an error event instead of an HTTP error.
+    """
+    try:
+        async for text in autopilot_service.stream_command(command):
+            yield _format_event(text)
+    except Exception as e:
+        logger.error(
+            "Autopilot error for drone %s: %s - Command: %s",
+            autopilot_service.drone_service.drone.drone_id,
+            e,
+            command,
+        )
+        yield _format_event(str(e), event="error")
+
+
+@router.post("/{drone_id}/command/stream/")
+async def stream_command(
+    command_input: CommandInput,
+    autopilot_service: AutoPilotService = Depends(get_autopilot_service),
+) -> StreamingResponse:
+    """
+    Execute a natural language command, streaming the agent's reply as
+    server-sent events.
+
+    GZipMiddleware passes text/event-stream responses through uncompressed,
+    so each event reaches the client as soon as the agent produces it.
+    """
+    return StreamingResponse(
+        _stream_reply(autopilot_service, command_input.command),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @router.get("/{drone_id}/chat_history/")
-def get_chat_history(
+async def get_chat_history(
     drone_id: str, autopilot_service: AutoPilotService = Depends(get_autopilot_service)
 ) -> List[Dict[str, str]]:
     """Get the chat history for the specified drone."""
@@ -86,109 +143,128 @@ def get_chat_history(
 
 
 @router.get("/{drone_id}/ham_chat_history/")
-def get_ham_chat_history(
+async def get_ham_chat_history(
     drone_id: str, autopilot_service: AutoPilotService = Depends(get_autopilot_service)
 ) -> List[Dict[str, Any]]:
     """Get the ham chat history for the specified drone."""
     return [msg.model_dump() for msg in autopilot_service.memory]
 
 
-@router.post("/{drone_id}/takeoff/")
+@router.post("/{drone_id}/takeoff/", response_model=Dict[str, str])
 def take_off(
     drone_service: DroneServiceBase = Depends(get_drone_service),
-) -> Dict[str, str]:
+) -> ORJSONResponse:
     """Command drone to take off to the specified altitude."""
     try:
         drone_service.take_off()
-        return {
-            "status": "success",
-            "message": "Taking off to altitude 1 meter",
-        }
-    except (DroneException, OutOfBoundsException) as e:
-        logger.error(
-            f"Takeoff failed for drone {drone_service.drone.drone_id}: {str(e)}"
+        return ORJSONResponse(
+            {"status": "success", "message": "Taking off to altitude 1 meter"}
         )
+    except (DroneException, OutOfBoundsException) as e:
+        logger.error("Takeoff failed for drone %s: %s", drone_service.drone.drone_id, e)
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/{drone_id}/land/")
+@router.post("/{drone_id}/land/", response_model=Dict[str, str])
 def land(
     drone_service: DroneServiceBase = Depends(get_drone_service),
-) -> Dict[str, str]:
+) -> ORJSONResponse:
     """Command drone to land."""
     try:
         drone_service.land()
-        return {"status": "success", "message": "Landing initiated"}
+        return ORJSONResponse({"status": "success", "message": "Landing initiated"})
     except (DroneException, OutOfBoundsException) as e:
-        logger.error(
-            f"Landing failed for drone {drone_service.drone.drone_id}: {str(e)}"
-        )
+        logger.error("Landing failed for drone %s: %s", drone_service.drone.drone_id, e)
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/{drone_id}/move_global/")
+@router.post("/{drone_id}/move_global/", response_model=Dict[str, str])
 def move_global(
     target: Location, drone_service: DroneServiceBase = Depends(get_drone_service)
-) -> Dict[str, str]:
+) -> ORJSONResponse:
     """Command drone to move to the specified location."""
     try:
         drone_service.move_global(target)
-        return {
-            "status": "success",
-            "message": f"Moving to location ({target.x}, {target.y}, {target.z})",
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "message": f"Moving to location ({target.x}, {target.y}, {target.z})",
+            }
+        )
     except (DroneException, OutOfBoundsException) as e:
         logger.error(
-            f"Move operation failed for drone {drone_service.drone.drone_id} to location ({target.x}, {target.y}, {target.z}): {str(e)}"
+            "Move operation failed for drone %s to location (%s, %s, %s): %s",
+            drone_service.drone.drone_id,
+            target.x,
+            target.y,
+            target.z,
+            e,
         )
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/{drone_id}/move_body/")
+@router.post("/{drone_id}/move_body/", response_model=Dict[str, str])
 def move_body(
     target: Location, drone_service: DroneServiceBase = Depends(get_drone_service)
-) -> Dict[str, str]:
+) -> ORJSONResponse:
     """Command drone to move to the specified location."""
     try:
         drone_service.move_body(target)
-        return {
-            "status": "success",
-            "message": f"Moving to location ({target.x}, {target.y}, {target.z})",
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "message": f"Moving to location ({target.x}, {target.y}, {target.z})",
+            }
+        )
     except (DroneException, OutOfBoundsException) as e:
         logger.error(
-            f"Move operation failed for drone {drone_service.drone.drone_id} to location ({target.x}, {target.y}, {target.z}): {str(e)}"
+            "Move operation failed for drone %s to location (%s, %s, %s): %s",
+            drone_service.drone.drone_id,
+            target.x,
+            target.y,
+            target.z,
+            e,
         )
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/{drone_id}/turn_global/")
+@router.post("/{drone_id}/turn_global/", response_model=Dict[str, str])
 def turn_global(
     request: TurnRequest,
     drone_service: DroneServiceBase = Depends(get_drone_service),
-) -> Dict[str, str]:
+) -> ORJSONResponse:
     """Command drone to turn to the specified angle."""
     try:
         drone_service.turn_global(request.angle)
-        return {"status": "success", "message": f"Turning to {request.angle} degrees"}
+        return ORJSONResponse(
+            {"status": "success", "message": f"Turning to {request.angle} degrees"}
+        )
     except (DroneException, OutOfBoundsException) as e:
         logger.error(
-            f"Turn operation failed for drone {drone_service.drone.drone_id} to angle {request.angle}: {str(e)}"
+            "Turn operation failed for drone %s to angle %s: %s",
+            drone_service.drone.drone_id,
+            request.angle,
+            e,
         )
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/{drone_id}/turn_body/")
+@router.post("/{drone_id}/turn_body/", response_model=Dict[str, str])
 def turn_body(
     request: TurnRequest,
     drone_service: DroneServiceBase = Depends(get_drone_service),
-) -> Dict[str, str]:
+) -> ORJSONResponse:
     """Command drone to turn to the specified angle at body frame"""
     try:
         drone_service.turn_body(request.angle)
-        return {"status": "success", "message": f"Turning to {request.angle} degrees"}
+        return ORJSONResponse(
+            {"status": "success", "message": f"Turning to {request.angle} degrees"}
+        )
     except (DroneException, OutOfBoundsException) as e:
         logger.error(
-            f"Turn operation failed for drone {drone_service.drone.drone_id} to angle {request.angle}: {str(e)}"
+            "Turn operation failed for drone %s to angle %s: %s",
+            drone_service.drone.drone_id,
+            request.angle,
+            e,
         )
         raise HTTPException(status_code=400, detail=str(e))
@@ -1,22 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
-from src.controller.environment import get_environment_instance
 from src.models.physical_models import DroneData
 from src.services.drone_base import DroneServiceBase
+from src.services.environment import EnvironmentService
 
 router = APIRouter(prefix="/drone", tags=["drone"])
 
 
-def get_drone_service(drone_id: str) -> DroneServiceBase:
+async def get_drone_service(drone_id: str, request: Request) -> DroneServiceBase:
     """Dependency to get drone service by ID."""
-    environment = get_environment_instance()
-    if drone_id not in environment.drones:
+    # Read the environment directly; this runs on every drone request
+    environment: EnvironmentService = request.app.state.environment
+    drone_service = environment.drones.get(drone_id)
+    if drone_service is None:
         raise HTTPException(status_code=404, detail=f"Drone {drone_id} not found")
-    return environment.drones[drone_id]
+    return drone_service
 
 
 @router.get("/{drone_id}/details/", response_model=DroneData)
-def get_drone_details(
+async def get_drone_details(
     drone_service: DroneServiceBase = Depends(get_drone_service),
-):
-    return drone_service.drone
+) -> ORJSONResponse:
+    """Get the details of a drone, encoded directly with orjson."""
+    return ORJSONResponse(drone_service.drone.model_dump())
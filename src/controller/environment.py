@@ -1,18 +1,19 @@
+import secrets
 import time
-import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Type
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 from src.models.physical_models import (
-    DroneModel,
     DroneState,
     DroneType,
     Location,
     Telemetry,
 )
 from src.services.crazyflie_drone import CrazyFlieService
+from src.services.drone_base import DroneServiceBase
 from src.services.environment import EnvironmentService
 from src.services.simulation_drone import SimulationDroneService
 from src.services.autopilot_service import AutoPilotService
@@ -27,49 +28,27 @@ class CreateDroneRequest(BaseModel):
     location: Location
 
 
-# Reference to the environment instance
-_environment_instance = None
+async def get_environment_instance(request: Request) -> EnvironmentService:
+    """Dependency to get the environment instance stored on the application."""
+    return request.app.state.environment
 
 
-def get_environment_instance() -> EnvironmentService:
-    """Get the global environment instance."""
-    global _environment_instance
-    if _environment_instance is None:
-        raise RuntimeError("Environment instance not initialized")
-    return _environment_instance
-
-
-def set_environment_instance(environment: EnvironmentService) -> None:
-    """Set the global environment instance."""
-    global _environment_instance
-    _environment_instance = environment
-
-
-@router.get("/state/")
-def get_environment_state(
-    environment: EnvironmentService = Depends(get_environment_instance),
-) -> Dict[str, Any]:
+@router.get("/state/", response_model=Dict[str, Any])
+async def get_environment_state(request: Request) -> Response:
     """Get the current state of the environment for visualization."""
-    # Get environment state
-    env_state = {
-        "time": environment.time,
-        "features": environment.features.model_dump(),
-    }
-
-    # Get all drone positions
-    drones = {
-        drone_id: drone_service.drone.model_dump()
-        for drone_id, drone_service in environment.drones.items()
-    }
-    return {"environment": env_state, "drones": drones}
+    # Polled endpoint: read the environment directly instead of through Depends
+    environment: EnvironmentService = request.app.state.environment
+    # Encoded once per simulation tick and shared by every poll within it
+    return Response(environment.get_state_json(), media_type="application/json")
 
 
 @router.post("/restart-simulation/")
-def restart_simulation():
+def restart_simulation(
+    environment: EnvironmentService = Depends(get_environment_instance),
+):
     """Restart the entire simulation from zero."""
     try:
         # Reset the environment
-        environment = get_environment_instance()
         environment.reset()
 
         return {
@@ -82,44 +61,43 @@ def restart_simulation():
         )
 
 
-# Add example endpoint to create a default drone
-@router.post("/create-simulation-drone/", response_model=str)
-def create_default_simulation_drone(
+# Drone service implementation used for each drone type
+_SERVICE_FOR_TYPE: Dict[DroneType, Type[DroneServiceBase]] = {
+    DroneType.SIMULATION: SimulationDroneService,
+    DroneType.CRAZYFLIE: CrazyFlieService,
+}
+
+
+def _create_drone(
     request: CreateDroneRequest,
-):
-    """Create a default drone for testing."""
+    drone_type: DroneType,
+    environment: EnvironmentService,
+) -> str:
+    """Create a drone of the given type with its autopilot and register both."""
     try:
-        # Create default drone model based on settings
-        from src.config.settings import Settings
-
-        model = DroneModel(
-            name=request.name,
-            max_speed=Settings.default_drone_max_speed,
-            max_yaw_rate=Settings.default_drone_max_yaw_rate,
-            max_vertical_speed=Settings.default_drone_max_vertical_speed,
-            max_altitude=Settings.default_drone_max_altitude,
-            weight=Settings.default_drone_weight,
-            dimensions=Settings.default_drone_dimensions,
-            fuel_capacity=Settings.default_drone_fuel_capacity,
-            fuel_consumption_rate=Settings.default_drone_fuel_consumption_rate,
-            type=DroneType.SIMULATION,
+        # Create the drone model from the default specification
+        model = environment.default_drone_model.model_copy(
+            update={"name": request.name, "type": drone_type}
         )
 
         # Create drone at a safe starting position
-        environment = get_environment_instance()
         telemetry = Telemetry(
             position=request.location,
             heading=0.0,
             state=DroneState.IDLE,
         )
         # Create drone service
-        drone_id = str(uuid.uuid4())[:4]
-        drone_service: SimulationDroneService = SimulationDroneService.create_drone(
-            model=model, telemetry=telemetry, drone_id=drone_id
+        drone_id = secrets.token_hex(2)
+        drone_service = _SERVICE_FOR_TYPE[drone_type].create_drone(
+            model=model,
+            telemetry=telemetry,
+            drone_id=drone_id,
+            environment=environment,
         )
         autopilot_service = AutoPilotService.create_autopilot_service(drone_service)
         environment.drones[drone_service.drone.drone_id] = drone_service
         environment.autopilot_agents[drone_service.drone.drone_id] = autopilot_service
+        environment.invalidate_state()
 
         return drone_service.drone.drone_id
 
@@ -127,52 +105,37 @@ def create_default_simulation_drone(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+# Add example endpoint to create a default drone
+@router.post("/create-simulation-drone/", response_model=str)
+def create_default_simulation_drone(
+    request: CreateDroneRequest,
+    environment: EnvironmentService = Depends(get_environment_instance),
+):
+    """Create a default drone for testing."""
+    return _create_drone(request, DroneType.SIMULATION, environment)
+
+
 @router.post("/create-crazyflie-drone/", response_model=str)
 def create_crazyflie_drone(
     request: CreateDroneRequest,
+    environment: EnvironmentService = Depends(get_environment_instance),
 ):
     """Create a CrazyFlie drone for testing."""
-    from src.config.settings import Settings
-
-    try:
-        environment = get_environment_instance()
-        model = DroneModel(
-            name=request.name,
-            max_speed=Settings.default_drone_max_speed,
-            max_yaw_rate=Settings.default_drone_max_yaw_rate,
-            max_vertical_speed=Settings.default_drone_max_vertical_speed,
-            max_altitude=Settings.default_drone_max_altitude,
-            weight=Settings.default_drone_weight,
-            dimensions=Settings.default_drone_dimensions,
-            fuel_capacity=Settings.default_drone_fuel_capacity,
-            fuel_consumption_rate=Settings.default_drone_fuel_consumption_rate,
-            type=DroneType.CRAZYFLIE,
-        )
-        drone_id = str(uuid.uuid4())[:4]
-        telemetry = Telemetry(
-            position=request.location,
-            heading=0.0,
-            state=DroneState.IDLE,
-        )
-        drone_service: CrazyFlieService = CrazyFlieService.create_drone(
-            model=model, telemetry=telemetry, drone_id=drone_id
-        )
-        autopilot_service = AutoPilotService.create_autopilot_service(drone_service)
-        environment.drones[drone_service.drone.drone_id] = drone_service
-        environment.autopilot_agents[drone_service.drone.drone_id] = autopilot_service
-
-        return drone_service.drone.drone_id
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _create_drone(request, DroneType.CRAZYFLIE, environment)
 
 
 @router.post("/{drone_id}/remove-drone/")
-def remove_drone(drone_id: str):
+def remove_drone(
+    drone_id: str,
+    environment: EnvironmentService = Depends(get_environment_instance),
+):
     """Remove a drone from the environment."""
-    environment = get_environment_instance()
-    service = environment.drones[drone_id]
+    service = environment.drones.get(drone_id)
+    if service is None:
+        raise HTTPException(status_code=404, detail=f"Drone {drone_id} not found")
     service.stop_service()
     time.sleep(5)
     environment.drones.pop(drone_id)
-    environment.autopilot_agents.pop(drone_id)
+    environment.autopilot_agents.pop(drone_id).stop()
+    environment.invalidate_state()
     return {"status": "success", "message": "Drone removed successfully"}
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DroneState(str, Enum):
@@ -25,6 +25,9 @@ class DroneType(str, Enum):
 class DroneModel(BaseModel):
     """Model containing static drone specifications."""
 
+    # Specifications never change after creation; copies share nothing mutable
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: DroneType = Field(description="Type of drone")
     max_speed: float = Field(description="Maximum speed in m/s")
@@ -44,6 +47,9 @@ class DroneModel(BaseModel):
 class Location(BaseModel):
     """Location model representing 3D coordinates."""
 
+    # Immutable so a position can be shared between telemetry snapshots safely
+    model_config = ConfigDict(frozen=True)
+
     x: float = Field(default=0.0, description="X coordinate")
     y: float = Field(default=0.0, description="Y coordinate")
     z: float = Field(default=0.0, description="Z coordinate (altitude)")
@@ -0,0 +1,188 @@
+"""
+LangChain/LangGraph agent definition for the autopilot service.
+
+This module is imported lazily by AutoPilotService so the heavy LangChain
+and LangGraph imports are only paid once an autopilot is actually created.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Tuple
+
+from langchain.prompts import PromptTemplate
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import tool
+from langgraph.prebuilt import create_react_agent
+
+from src.config.llm_config import get_llm_object
+from src.models.physical_models import Location
+from src.services.drone_base import DroneServiceBase
+
+if TYPE_CHECKING:
+    from src.services.autopilot_service import AutoPilotService
+
+SYSTEM_PROMPT = """You are the autopilot of a drone in a simulated environment. Turn the operator's commands into tool calls.
+- Check the current status before moving; take off first if the drone is on the ground.
+- Keep targets inside the environment boundaries and away from buildings.
+- Refuse unsafe commands and say why.
+- After acting, briefly report the result and the drone's status.
+- Reply in the same language as the command.
+"""
+
+# Per-call context, sent after the static instructions so their prefix stays
+# byte-identical between calls and can be served from Gemini's context cache;
+# the conversation itself follows as the graph state's messages
+CONTEXT_PROMPT = """## CURRENT STATUS
+{telemetry}
+
+## BUILDINGS
+{buildings}
+"""
+
+
+PROMPT_TEMPLATE = PromptTemplate(
+    template=CONTEXT_PROMPT,
+    input_variables=["telemetry", "buildings"],
+)
+
+
+def _get_autopilot(config: RunnableConfig) -> "AutoPilotService":
+    """Get the autopilot service a graph run was started for."""
+    return config["configurable"]["autopilot"]
+
+
+def _get_drone_service(config: RunnableConfig) -> DroneServiceBase:
+    """Get the drone service a graph run was started for."""
+    return _get_autopilot(config).drone_service
+
+
+def _prepare_context(config: RunnableConfig) -> HumanMessage:
+    """Prepare the per-call context for the autopilot the run was started for."""
+    drone_service = _get_drone_service(config)
+    context = PROMPT_TEMPLATE.format(
+        telemetry=drone_service.get_telemetry(),
+        buildings=drone_service.environment.get_buildings_prompt(),
+    )
+    return HumanMessage(content=context)
+
+
+def _prepare_prompt(state, config: RunnableConfig) -> List[BaseMessage]:
+    """Prepare the prompt for the autopilot the graph run was started for."""
+    return [
+        SystemMessage(content=SYSTEM_PROMPT),
+        _prepare_context(config),
+        *state["messages"],
+    ]
+
+
+@tool("take_off")
+async def take_off(config: RunnableConfig) -> str:
+    """Command the drone to take off. Only possible while it is IDLE on the ground."""
+    drone_service = _get_drone_service(config)
+    try:
+        await asyncio.to_thread(drone_service.take_off)
+        telemetry = drone_service.get_telemetry()
+        return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
+    except Exception as e:
+        return f"Take off failed: {str(e)}"
+
+
+@tool("land")
+async def land(config: RunnableConfig) -> str:
+    """Command the drone to land at its current position while FLYING or in EMERGENCY."""
+    drone_service = _get_drone_service(config)
+    try:
+        await asyncio.to_thread(drone_service.land)
+        return "Drone successfully landed"
+    except Exception as e:
+        return f"Landing failed: {str(e)}"
+
+
+@tool("turn_body")
+async def turn_body(angle: float, config: RunnableConfig) -> str:
+    """Command the drone to turn at yaw in a specific angle in the body frame. The angle is relative to the current heading. An example ccw is negative and cw is positive."""
+    drone_service = _get_drone_service(config)
+    try:
+        await asyncio.to_thread(drone_service.turn_global, angle)
+        telemetry = drone_service.get_telemetry()
+        return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
+    except Exception as e:
+        return f"Turn failed: {str(e)}"
+
+
+@tool("turn_global")
+async def turn_global(angle: float, config: RunnableConfig) -> str:
+    """Command the drone to turn at yawin a specific angle."""
+    drone_service = _get_drone_service(config)
+    try:
+        await asyncio.to_thread(drone_service.turn_global, angle)
+        return f"Drone turning {angle} degrees"
+    except Exception as e:
+        return f"Turn failed: {str(e)}"
+
+
+@tool("move_to_body")
+async def move_to_body(
+    x: float, y: float, z: float, config: RunnableConfig
+) -> str:
+    """Command the drone to move to a specific 3D coordinate (x, y, z) in the body frame. The coordinates are relative to the current position of the drone. The drone must be FLYING."""
+    drone_service = _get_drone_service(config)
+    try:
+        location = Location.model_construct(x=x, y=y, z=z)
+        await asyncio.to_thread(drone_service.move_global, location)
+        telemetry = drone_service.get_telemetry()
+        return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
+    except Exception as e:
+        return f"Move failed: {str(e)}"
+
+
+@tool("move_to_global")
+async def move_to_global(
+    x: float, y: float, z: float, config: RunnableConfig
+) -> str:
+    """Command the drone to move to a specific 3D coordinate (x, y, z) in meters, z being the altitude. The drone must be FLYING."""
+    drone_service = _get_drone_service(config)
+    try:
+        location = Location.model_construct(x=x, y=y, z=z)
+        await asyncio.to_thread(drone_service.move_global, location)
+        telemetry = drone_service.get_telemetry()
+        return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
+    except Exception as e:
+        return f"Move failed: {str(e)}"
+
+
+@tool("get_telemetry")
+def get_telemetry(config: RunnableConfig) -> str:
+    """Get current drone telemetry including position, fuel level, speed, and state."""
+    telemetry = _get_drone_service(config).get_telemetry()
+    return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
+
+
+DRONE_TOOLS = [
+    take_off,
+    land,
+    turn_body,
+    turn_global,
+    move_to_body,
+    move_to_global,
+    get_telemetry,
+]
+
+# Compiled agent graphs shared by every drone, keyed by model and tool names
+_GRAPH_CACHE: Dict[Tuple[str, FrozenSet[str]], Any] = {}
+
+
+def get_agent_graph(model_name: str, tools: List[Any]) -> Any:
+    """Get the compiled ReAct agent graph, building it on first use."""
+    key = (model_name, frozenset(t.name for t in tools))
+    agent = _GRAPH_CACHE.get(key)
+    if agent is None:
+        # The prebuilt ToolNode runs every tool call of one model turn
+        # concurrently under astream, so the tools are kept async
+        agent = create_react_agent(
+            model=get_llm_object(model_name),
+            tools=tools,
+            prompt=_prepare_prompt,
+        )
+        _GRAPH_CACHE[key] = agent
+    return agent
@@ -1,88 +1,51 @@
+import asyncio
+import re
 import warnings
-from typing import Any, Dict, List
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 
-from langchain.chat_models import init_chat_model
-from langchain.prompts import PromptTemplate
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
-from langchain_core.tools import tool
-from langgraph.prebuilt import create_react_agent
-
-from src.constant.keys import GOOGLE_API_KEY
+from src.config.settings import get_settings
+from src.constant.constants import AUTOPILOT_CHAT_HISTORY_WINDOW
 from src.models import (
     AgentNotInitializedException,
+    AutopilotException,
     InvalidCommandException,
 )
-from src.models.physical_models import BuildingInformation, Location
 from src.services.drone_base import DroneServiceBase
 from src.utils.logger import logger
 
-warnings.filterwarnings("ignore", category=DeprecationWarning)
-
-SYSTEM_PROMPT = """You are an intelligent drone autopilot agent designed to interpret natural language commands and execute precise drone operations in a simulated environment. You have complete control over a simulation drone through a comprehensive set of specialized tools.
-
-## YOUR MISSION
-You serve as the bridge between human operators and drone hardware, translating conversational commands into safe, efficient flight operations. Your responses should be professional, informative, and always prioritize safety.
-
-## AVAILABLE CAPABILITIES
-You have access to the following drone control tools:
-
-1. **get_telemetry()** - Retrieve real-time drone status including:
-   - Current 3D position (x, y, z coordinates)
-   - Flight state (GROUNDED, TAKING_OFF, FLYING, LANDING, etc.)
-   - Fuel/battery level
-   - Speed and velocity vectors
-   - System health indicators
-
-2. **take_off()** - Command drone to launch from ground to 1-meter altitude
-   - Only works when drone is GROUNDED
-   - Automatically sets altitude to 1 meter for safety
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
 
-3. **land()** - Command drone to descend and land at current location
-   - Can be executed from any flying state
-   - Drone will automatically navigate to ground level
-
-4. **move_to(x, y, z)** - Navigate drone to specific 3D coordinates
-   - Requires drone to be in FLYING state (take off first if grounded)
-   - Parameters: x (east-west), y (north-south), z (altitude in meters)
-   - Always validate coordinates are reasonable and safe
-
-5. **get_buildings()** - Query environment for building information
-   - Returns list of all structures with positions and dimensions
-   - Use this for obstacle avoidance and navigation planning
+warnings.filterwarnings("ignore", category=DeprecationWarning)
 
-## OPERATIONAL PROTOCOLS
+# Single-step commands that the light model handles as well as the default one
+_SIMPLE_COMMAND_PATTERN = re.compile(
+    r"\s*(please\s+)?(take\s*-?\s*off|land|stop|kalk|in|dur"
+    r"|(what('s|\s+is)\s+(the\s+|my\s+)?)?(status|battery|fuel|telemetry|position)"
+    r"|durum|batarya|konum|neredesin)\s*[.!?]?\s*",
+    re.IGNORECASE,
+)
 
-**Safety First:**
-- Always check current telemetry before executing movement commands
-- Ensure drone is in appropriate state for requested operation
-- Validate coordinates are within safe operational boundaries
-- Consider obstacle avoidance using building information
 
-**Command Execution Sequence:**
-1. Assess current drone state via telemetry
-2. Determine required sequence of operations
-3. Execute commands in logical order (e.g., take off before movement)
-4. Provide clear status updates after each action
-5. Confirm successful completion or report any issues
+def is_simple_command(command: str) -> bool:
+    """Check whether a command is a single step that needs no planning."""
+    return _SIMPLE_COMMAND_PATTERN.fullmatch(command) is not None
 
-**Response Guidelines:**
-- Be conversational but professional
-- Explain what you're doing and why
-- Report current status after actions
-- If commands fail, explain the issue and suggest alternatives
-- For complex operations, break them into clear steps
 
-IMPORTANT WARNING: Communicate with the user in the same language as the command.
+@dataclass
+class CommandResult:
+    """Outcome of one autopilot command run as part of a batch."""
 
-## CURRENT STATUS
-{telemetry}
+    __slots__ = ("command", "status", "result")
 
-## BUILDINGS
-{buildings}
+    command: str
+    status: str
+    result: str
 
-## CHAT HISTORY
-{chat_history}
-"""
+    def to_dict(self) -> Dict[str, str]:
+        """Get the result as a plain dict."""
+        return asdict(self)
 
 
 class AutoPilotService:
@@ -90,150 +53,74 @@ class AutoPilotService:
 
     @classmethod
     def create_autopilot_service(
-        cls, drone_service: DroneServiceBase
+        cls,
+        drone_service: DroneServiceBase,
+        window_k: int = AUTOPILOT_CHAT_HISTORY_WINDOW,
     ) -> "AutoPilotService":
         """Create an autopilot service for a drone."""
-        return cls(drone_service)
-
-    def __init__(self, drone_service: DroneServiceBase):
-        """Initialize the Gemini autopilot agent."""
-        from src.config.settings import Settings
-
+        return cls(drone_service, window_k=window_k)
+
+    def __init__(
+        self,
+        drone_service: DroneServiceBase,
+        window_k: int = AUTOPILOT_CHAT_HISTORY_WINDOW,
+    ):
+        """
+        Initialize the Gemini autopilot agent.
+
+        Args:
+            drone_service: The drone this autopilot controls
+            window_k: Number of most recent commands kept in the prompt
+        """
         # Create the LangGraph agent using ReAct agent
         try:
+            # Imported here so LangChain/LangGraph only load once an autopilot exists
+            from src.services.autopilot_agent import DRONE_TOOLS, get_agent_graph
+
             self.drone_service = drone_service
-            # Set up memory
-            self.memory: List[BaseMessage] = []
-            self.agent = create_react_agent(
-                model=init_chat_model(
-                    model=Settings.langchain_model,
-                    max_tokens=128000,
-                    max_retries=3,
-                    temperature=0.2,
-                    google_api_key=GOOGLE_API_KEY,
-                ),
-                tools=self._create_drone_tools(),
-                prompt=self._prepare_prompt,
-            )
+            # Set up memory; only the last window_k commands reach the model
+            self.memory: List["BaseMessage"] = []
+            self.window_k = window_k
+            # The compiled graph is shared; tools resolve this drone from the run config
+            self.agent = get_agent_graph(get_settings().langchain_model, DRONE_TOOLS)
             self.is_initialized = True
         except Exception as e:
             raise InvalidCommandException(f"Failed to create agent: {str(e)}")
 
-    def _create_chat_history(self) -> str:
-        """Create the chat history."""
-        chat_history = ""
-        for message in self.memory:
-            if isinstance(message, HumanMessage):
-                chat_history += f"--------\nHuman: {message.content}\n"
-            elif isinstance(message, AIMessage):
-                chat_history += f"--------\nAI Message: {message.content}\nAI Tool Calls: {message.tool_calls}\n"
-            elif isinstance(message, ToolMessage):
-                chat_history += f"--------\nTool Response: {message.content}\n"
-        return chat_history
-
-    def _prepare_prompt(self, state) -> str:
-        """Prepare the prompt for the agent."""
-        prompt = PromptTemplate(
-            template=SYSTEM_PROMPT,
-            input_variables=["telemetry", "buildings"],
-        )
-        buildings: List[BuildingInformation] = (
-            self.drone_service.environment.features.buildings
-        )
-        buildings_str = "\n".join(
-            [str(building.model_dump()) for building in buildings]
-        )
-        chat_history = self._create_chat_history()
-        prepared_prompt = prompt.format(
-            telemetry=self.drone_service.get_telemetry(),
-            buildings=buildings_str,
-            chat_history=chat_history,
-        )
-
-        return prepared_prompt
-
-    def _create_drone_tools(self) -> List[Any]:
-        """Create tools from drone service methods."""
-
-        @tool("take_off")
-        def take_off() -> str:
-            """Command the drone to take off."""
-            try:
-                self.drone_service.take_off()
-                telemetry = self.drone_service.get_telemetry()
-                return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
-            except Exception as e:
-                return f"Take off failed: {str(e)}"
-
-        @tool("land")
-        def land() -> str:
-            """Command the drone to land."""
-            try:
-                self.drone_service.land()
-                return "Drone successfully landed"
-            except Exception as e:
-                return f"Landing failed: {str(e)}"
-
-        @tool("turn_body")
-        def turn_body(angle: float) -> str:
-            """Command the drone to turn at yaw in a specific angle in the body frame. The angle is relative to the current heading. An example ccw is negative and cw is positive."""
-            try:
-                self.drone_service.turn_global(angle)
-                telemetry = self.drone_service.get_telemetry()
-                return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
-            except Exception as e:
-                return f"Turn failed: {str(e)}"
-
-        @tool("turn_global")
-        def turn_global(angle: float) -> str:
-            """Command the drone to turn at yawin a specific angle."""
-            try:
-                self.drone_service.turn_global(angle)
-                return f"Drone turning {angle} degrees"
-            except Exception as e:
-                return f"Turn failed: {str(e)}"
-
-        @tool("move_to_body")
-        def move_to_body(x: float, y: float, z: float) -> str:
-            """Command the drone to move to a specific 3D coordinate (x, y, z) in the body frame. The coordinates are relative to the current position of the drone."""
-            try:
-                location = Location(x=x, y=y, z=z)
-                self.drone_service.move_global(location)
-                telemetry = self.drone_service.get_telemetry()
-                return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
-            except Exception as e:
-                return f"Move failed: {str(e)}"
-
-        @tool("move_to_global")
-        def move_to_global(x: float, y: float, z: float) -> str:
-            """Command the drone to move to a specific 3D coordinate (x, y, z)."""
-            try:
-                location = Location(x=x, y=y, z=z)
-                self.drone_service.move_global(location)
-                telemetry = self.drone_service.get_telemetry()
-                return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
-            except Exception as e:
-                return f"Move failed: {str(e)}"
-
-        @tool("get_telemetry")
-        def get_telemetry() -> Dict[str, Any]:
-            """Get current drone telemetry including position, fuel level, speed, and state."""
-            telemetry = self.drone_service.get_telemetry()
-            return f"Operation successfull, drones current telemetry: {str(telemetry.model_dump())}"
-
-        # Return the list of tools
-        return [
-            take_off,
-            land,
-            turn_body,
-            turn_global,
-            move_to_body,
-            move_to_global,
-            get_telemetry,
-        ]
+        # Commands of this drone run one at a time; the lock is created lazily
+        # on the serving event loop
+        self._command_lock: Optional[asyncio.Lock] = None
+        self._is_stopped = False
+
+    def _get_history_window(self) -> List["BaseMessage"]:
+        """Get the messages of the last commands that fit in the prompt window."""
+        from langchain_core.messages import HumanMessage
+
+        commands = 0
+        for index in range(len(self.memory) - 1, -1, -1):
+            if isinstance(self.memory[index], HumanMessage):
+                commands += 1
+                if commands == self.window_k:
+                    return self.memory[index:]
+        return self.memory
+
+    def _select_agent(self, command: str) -> Any:
+        """Get the agent graph for a command, using the light model when simple."""
+        settings = get_settings()
+        if settings.langchain_light_model and is_simple_command(command):
+            from src.services.autopilot_agent import DRONE_TOOLS, get_agent_graph
+
+            return get_agent_graph(settings.langchain_light_model, DRONE_TOOLS)
+        return self.agent
+
+    def _run_config(self) -> Dict[str, Any]:
+        """Build the graph run config that binds the shared agent to this drone."""
+        return {"recursion_limit": 10, "configurable": {"autopilot": self}}
 
     def get_chat_history(self) -> List[Dict[str, str]]:
         """Get the chat history."""
+        from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
         messages = []
         for msg in self.memory:
             if (
@@ -253,26 +140,128 @@ class AutoPilotService:
             messages.append({"message_type": sender, "content": msg.content})
         return messages
 
-    def execute_command(self, command: str) -> Dict[str, Any]:
-        """Execute a natural language command via the LangGraph agent."""
+    async def stream_command(self, command: str) -> AsyncIterator[str]:
+        """
+        Execute a command once the commands submitted before it have finished,
+        yielding agent text as it streams.
+        """
+        async with self._get_command_lock():
+            if self._is_stopped:
+                raise AutopilotException("Autopilot stopped, command not executed")
+            async for text in self._run_command(command):
+                yield text
+
+    async def _run_command(self, command: str) -> AsyncIterator[str]:
+        """Execute a natural language command, yielding agent text as it streams."""
         if not self.is_initialized:
             raise AgentNotInitializedException("Agent not initialized. Call first.")
 
+        from langchain_core.messages import HumanMessage
+
         try:
-            logger.info(f"Executing command: {command}")
+            logger.info("Executing command: %s", command)
             # Create a state with the command as a HumanMessage
             self.memory.append(HumanMessage(content=command))
-            # Execute the agent with the input state
-            for update_state in self.agent.stream(
-                input={"messages": self.memory},
-                config={"recursion_limit": 10},
-                stream_mode="updates",
+            # Execute the agent, recording node updates and forwarding model tokens
+            async for mode, chunk in self._select_agent(command).astream(
+                input={"messages": self._get_history_window()},
+                config=self._run_config(),
+                stream_mode=["updates", "messages"],
             ):
-                if "agent" in update_state:
-                    response = update_state["agent"]
-                elif "tools" in update_state:
-                    response = update_state["tools"]
+                if mode == "messages":
+                    message, metadata = chunk
+                    if (
+                        metadata.get("langgraph_node") == "agent"
+                        and isinstance(message.content, str)
+                        and message.content
+                    ):
+                        yield message.content
+                    continue
+
+                if "agent" in chunk:
+                    response = chunk["agent"]
+                elif "tools" in chunk:
+                    response = chunk["tools"]
                 self.memory.extend(response.get("messages", []))
         except Exception as e:
-            logger.error(f"Failed to execute command: {str(e)}")
+            logger.error("Failed to execute command: %s", e)
             raise InvalidCommandException(f"Failed to execute command: {str(e)}")
+
+    async def execute_command(self, command: str) -> str:
+        """
+        Execute a natural language command via the LangGraph agent.
+
+        Returns:
+            The agent's final reply to the command
+        """
+        from langchain_core.messages import AIMessage
+
+        first_message = len(self.memory)
+        async for _ in self._run_command(command):
+            pass
+        for message in reversed(self.memory[first_message:]):
+            if isinstance(message, AIMessage):
+                return message.content
+        return ""
+
+    async def run_batch(self, commands: List[str]) -> List[CommandResult]:
+        """
+        Run several independent commands one after another and collect their
+        results.
+
+        The batch holds the drone's command lock, so it does not interleave
+        with submitted or streamed commands. Each command runs as its own
+        agent invocation and is not added to the chat memory. A failing
+        command does not affect the others, and the commands still pending
+        when the autopilot is stopped are not run.
+
+        Args:
+            commands: Natural language commands to run
+
+        Returns:
+            One result per command, in the order the commands were given
+        """
+        if not self.is_initialized:
+            raise AgentNotInitializedException("Agent not initialized. Call first.")
+
+        from langchain_core.messages import HumanMessage
+
+        results: List[CommandResult] = []
+        async with self._get_command_lock():
+            for command in commands:
+                if self._is_stopped:
+                    results.append(
+                        CommandResult(
+                            command, "error", "Autopilot stopped, command not executed"
+                        )
+                    )
+                    continue
+                try:
+                    state = await self._select_agent(command).ainvoke(
+                        {"messages": [HumanMessage(content=command)]},
+                        config=self._run_config(),
+                    )
+                    results.append(
+                        CommandResult(command, "success", state["messages"][-1].content)
+                    )
+                except Exception as e:
+                    logger.error("Failed to execute batched command: %s", e)
+                    results.append(CommandResult(command, "error", str(e)))
+        return results
+
+    def _get_command_lock(self) -> asyncio.Lock:
+        """Get the lock that serializes the commands of this drone."""
+        if self._command_lock is None:
+            self._command_lock = asyncio.Lock()
+        return self._command_lock
+
+    async def submit_command(self, command: str) -> str:
+        """Execute a command once the commands submitted before it have finished."""
+        async with self._get_command_lock():
+            if self._is_stopped:
+                raise AutopilotException("Autopilot stopped, command not executed")
+            return await self.execute_command(command)
+
+    def stop(self) -> None:
+        """Reject the commands still waiting to run; safe to call from any thread."""
+        self._is_stopped = True
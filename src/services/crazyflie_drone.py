@@ -32,6 +32,9 @@ from src.utils.logger import logger
 
 # radio://0/80/2M/E7E7E7E7C3
 
+# States in which the drone accepts move and turn commands
+_MANOEUVRABLE_STATES = frozenset({DroneState.FLYING, DroneState.IDLE})
+
 
 class CrazyFlieService(DroneServiceBase):
     """
@@ -54,12 +57,14 @@ class CrazyFlieService(DroneServiceBase):
     def update(self) -> None:
         """Update the drone state based on elapsed time."""
         # elapsed_time = current_time - self._last_update_time
-        self._last_update_time = time.time()
+        self._last_update_time = time.monotonic()
 
     def state_callback(self, timestamp, data, logconf):
-        self.drone.telemetry.position.x = data["stateEstimate.x"]
-        self.drone.telemetry.position.y = data["stateEstimate.y"]
-        self.drone.telemetry.position.z = data["stateEstimate.z"]
+        self.drone.telemetry.position = Location.model_construct(
+            x=data["stateEstimate.x"],
+            y=data["stateEstimate.y"],
+            z=data["stateEstimate.z"],
+        )
         self.drone.telemetry.heading = data["stateEstimate.yaw"]
 
     def start_service(self) -> None:
@@ -201,7 +206,7 @@ class CrazyFlieService(DroneServiceBase):
             logger.warning("Cannot move_to, service not running.")  # Added log
             raise RuntimeError("Service not running, cannot move_to.")
 
-        if self.drone.telemetry.state not in [DroneState.FLYING, DroneState.IDLE]:
+        if self.drone.telemetry.state not in _MANOEUVRABLE_STATES:
             raise DroneNotOperationalException(
                 f"Cannot move in {self.drone.telemetry.state} state"
             )
@@ -259,7 +264,7 @@ class CrazyFlieService(DroneServiceBase):
             logger.warning("Cannot turn, service not running.")  # Added log
             raise RuntimeError("Service not running, cannot turn.")
 
-        if self.drone.telemetry.state not in [DroneState.FLYING, DroneState.IDLE]:
+        if self.drone.telemetry.state not in _MANOEUVRABLE_STATES:
             raise DroneNotOperationalException(
                 f"Cannot turn in {self.drone.telemetry.state} state"
             )
@@ -307,10 +312,10 @@ class CrazyFlieService(DroneServiceBase):
             f"Commanding drone to move {relative_location.x}, {relative_location.y}, {relative_location.z}"
         )
 
-        target_location = Location(
-            self.drone.telemetry.position.x + relative_location.x,
-            self.drone.telemetry.position.y + relative_location.y,
-            self.drone.telemetry.position.z + relative_location.z,
+        target_location = Location.model_construct(
+            x=self.drone.telemetry.position.x + relative_location.x,
+            y=self.drone.telemetry.position.y + relative_location.y,
+            z=self.drone.telemetry.position.z + relative_location.z,
         )
 
         self.move_global(target_location)
@@ -1,15 +1,17 @@
 import threading
 import time
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from src.constant.constants import THREAD_UPDATE_INTERVAL
 from src.models.physical_models import (
     DroneData,
     DroneModel,
     Location,
     Telemetry,
 )
-from src.utils.logger import logger
+
+if TYPE_CHECKING:
+    from src.services.environment import EnvironmentService
 
 
 class DroneServiceBase(ABC):
@@ -18,10 +20,9 @@ class DroneServiceBase(ABC):
     def __init__(self, drone_data: DroneData):
         self.drone = drone_data
         self._stop_event = threading.Event()
-        self._drone_thread = None
         self._is_running = False
         self.environment = None
-        self._last_update_time = time.time()  # Added for consistency with simulation
+        self._last_update_time = time.monotonic()  # Added for consistency with simulation
 
     @classmethod
     def create_drone(
@@ -29,11 +30,9 @@ class DroneServiceBase(ABC):
         model: DroneModel,
         telemetry: Telemetry,
         drone_id: str,
+        environment: "EnvironmentService",
     ) -> "DroneServiceBase":
         """Factory method to create a new drone service instance."""
-        from src.controller.environment import get_environment_instance
-
-        environment = get_environment_instance()
         environment.validate_location(telemetry)
 
         # Create drone service
@@ -50,20 +49,6 @@ class DroneServiceBase(ABC):
         drone_service.environment = environment
         return drone_service
 
-    def _drone_loop(self) -> None:
-        """Internal drone loop that runs in a separate thread."""
-        logger.info(f"DroneData drone loop started for {self.drone.model.name}")
-        while not self._stop_event.is_set():
-            try:
-                self.update()
-            except Exception as e:
-                logger.error(f"Error in drone loop for {self.drone.model.name}: {e}")
-                # Decide if to break loop or continue
-
-            # Small sleep to prevent CPU overuse
-            self._stop_event.wait(THREAD_UPDATE_INTERVAL)
-        logger.info(f"DroneData drone loop stopped for {self.drone.model.name}")
-
     def get_telemetry(self) -> Telemetry:
         """Get current drone telemetry data."""
         return self.drone.telemetry
@@ -1,19 +1,30 @@
 import threading
 import time
-from typing import Dict
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
+from pydantic import TypeAdapter
+
+from src.config.settings import get_settings
 from src.models import (
     OutOfBoundsException,
 )
 from src.models.physical_models import (
     BuildingInformation,
+    DroneData,
+    DroneModel,
+    DroneType,
     EnvironmentFeatures,
     Telemetry,
 )
 from src.services.drone_base import DroneServiceBase
+from src.services.simulation_drone import SimulationDroneService
 from src.services.autopilot_service import AutoPilotService
 from src.utils.logger import logger
 
+# Serializes every drone in one pass with a schema built once at import
+_DRONES_ADAPTER = TypeAdapter(Dict[str, DroneData])
+
 
 class EnvironmentService:
     """Service for managing the environment state and interactions."""
@@ -21,16 +32,35 @@ class EnvironmentService:
     def __init__(self):
         """Initialize environment with boundaries."""
         logger.info("Initializing environment service")
-        from src.config.settings import Settings
+        settings = get_settings()
 
         self.features = EnvironmentFeatures(
-            boundaries=Settings.boundaries,
-            buildings=Settings.buildings,
+            boundaries=settings.boundaries,
+            buildings=settings.buildings,
+        )
+        # Serialized features and the rendered building list for the autopilot
+        # prompt, built on first use and dropped whenever the features change
+        self._features_state: Optional[Dict[str, Any]] = None
+        self._buildings_prompt: Optional[str] = None
+        # Encoded state payload and the simulation time it was built at
+        self._state_json: Optional[Tuple[float, bytes]] = None
+        # Default drone specification, copied for every new drone
+        self.default_drone_model = DroneModel(
+            name="",
+            max_speed=settings.default_drone_max_speed,
+            max_yaw_rate=settings.default_drone_max_yaw_rate,
+            max_vertical_speed=settings.default_drone_max_vertical_speed,
+            max_altitude=settings.default_drone_max_altitude,
+            weight=settings.default_drone_weight,
+            dimensions=settings.default_drone_dimensions,
+            fuel_capacity=settings.default_drone_fuel_capacity,
+            fuel_consumption_rate=settings.default_drone_fuel_consumption_rate,
+            type=DroneType.SIMULATION,
         )
         self.autopilot_agents: Dict[str, AutoPilotService] = {}
         self.drones: Dict[str, DroneServiceBase] = {}
         self.time = 0.0
-        self._last_update_time = time.time()
+        self._last_update_time = time.monotonic()
 
         # Threading setup
         self._stop_event = threading.Event()
@@ -43,6 +73,61 @@ class EnvironmentService:
     def add_obstacle(self, obstacle: BuildingInformation) -> None:
         """Add an obstacle to the environment."""
         self.features.buildings.append(obstacle)
+        self._invalidate_features_cache()
+
+    def _invalidate_features_cache(self) -> None:
+        """Drop the cached serializations of the environment features."""
+        self._features_state = None
+        self._buildings_prompt = None
+        self._state_json = None
+
+    def invalidate_state(self) -> None:
+        """Drop the cached state payload after drones were added or removed."""
+        self._state_json = None
+
+    def get_features_state(self) -> Dict[str, Any]:
+        """Get the environment features serialized for the state endpoint."""
+        if self._features_state is None:
+            self._features_state = self.features.model_dump()
+        return self._features_state
+
+    def get_buildings_prompt(self) -> str:
+        """Get the buildings rendered for the autopilot prompt, one per line."""
+        if self._buildings_prompt is None:
+            self._buildings_prompt = "\n".join(
+                [str(building.model_dump()) for building in self.features.buildings]
+            )
+        return self._buildings_prompt
+
+    def get_state_json(self) -> bytes:
+        """
+        Get the environment and drone state encoded as JSON.
+
+        The payload is encoded at most once per simulation tick and shared by
+        every poll within that tick. Adding or removing a drone drops it at
+        once, but telemetry changed by a command between two ticks (e.g. the
+        final position after a move or landing returns) shows up on the next
+        tick, up to 100 ms later.
+        """
+        current_time = self.time
+        cached = self._state_json
+        if cached is not None and cached[0] == current_time:
+            return cached[1]
+
+        # The drones are encoded straight to JSON bytes by pydantic-core,
+        # skipping the intermediate dicts, and spliced into the payload
+        drones = _DRONES_ADAPTER.dump_json(
+            {
+                drone_id: drone_service.drone
+                for drone_id, drone_service in self.drones.items()
+            }
+        )
+        environment = orjson.dumps(
+            {"time": current_time, "features": self.get_features_state()}
+        )
+        payload = b'{"environment":' + environment + b',"drones":' + drones + b"}"
+        self._state_json = (current_time, payload)
+        return payload
 
     def validate_location(self, telemetry: Telemetry) -> None:
         """Validate if a location is within bounds and not colliding with obstacles."""
@@ -65,7 +150,7 @@ class EnvironmentService:
 
     def update_simulation_time(self) -> None:
         """Update the simulation time based on real elapsed time."""
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed_time = current_time - self._last_update_time
         self._last_update_time = current_time
 
@@ -97,6 +182,8 @@ class EnvironmentService:
         for drone_id, drone_service in self.drones.items():
             drone_service.stop_service()
             logger.info(f"Drone {drone_id} stopped")
+        for autopilot_service in self.autopilot_agents.values():
+            autopilot_service.stop()
         time.sleep(5)
         self.drones.clear()
         self.autopilot_agents.clear()
@@ -110,10 +197,27 @@ class EnvironmentService:
             # Update simulation time
             self.update_simulation_time()
 
+            # Update every running simulated drone from this single thread
+            self._update_simulation_drones()
+
             # Small sleep to prevent CPU overuse
             # Using wait with timeout allows for responsive shutdown
             self._stop_event.wait(0.1)  # Update time every 100ms
 
+    def _update_simulation_drones(self) -> None:
+        """Advance the simulated drones by one environment tick."""
+        for drone_service in list(self.drones.values()):
+            if (
+                isinstance(drone_service, SimulationDroneService)
+                and drone_service._is_running
+            ):
+                try:
+                    drone_service.update()
+                except Exception as e:
+                    logger.error(
+                        "Error updating drone %s: %s", drone_service.drone.drone_id, e
+                    )
+
     def reset(self) -> None:
         """Reset the environment simulation to initial state."""
         logger.info("Resetting environment simulation")
@@ -123,14 +227,14 @@ class EnvironmentService:
 
         # Reset simulation time
         self.time = 0.0
-        self._last_update_time = time.time()
+        self._last_update_time = time.monotonic()
 
         # Reset environment state (keeping the same boundaries)
-        from src.config.settings import Settings
-
+        settings = get_settings()
         self.features = EnvironmentFeatures(
-            boundaries=Settings.boundaries, buildings=Settings.buildings
+            boundaries=settings.boundaries, buildings=settings.buildings
         )
+        self._invalidate_features_cache()
 
         # Restart the simulation thread
         self.start_simulation()
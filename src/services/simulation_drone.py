@@ -1,6 +1,7 @@
 import math
 import threading
 import time
+from typing import Optional, Tuple
 
 from src.constant.constants import CRAZYFLIE_TAKEOFF_ALTITUDE
 from src.models.exceptions import (
@@ -19,6 +20,14 @@ from src.models.physical_models import (
 from src.services.drone_base import DroneServiceBase
 from src.utils.logger import logger
 
+# Extra fuel burnt while climbing and descending, relative to level flight
+_TAKEOFF_FUEL_FACTOR = 1.2  # 20% more during takeoff
+_LANDING_FUEL_FACTOR = 1.1  # 10% more during landing
+
+# States a landing may start from, and states it continues descending in
+_LANDABLE_STATES = frozenset({DroneState.FLYING, DroneState.EMERGENCY})
+_LANDING_STATES = frozenset({DroneState.LANDING, DroneState.EMERGENCY})
+
 
 class SimulationDroneService(DroneServiceBase):
     """Service for managing drone operations and interactions with the environment."""
@@ -28,46 +37,101 @@ class SimulationDroneService(DroneServiceBase):
         super().__init__(drone_data)
         logger.info("Initializing drone service")
 
-        # Start the drone thread
+        # Active move as (start_time, end_time, start, target, fuel_required),
+        # advanced by update() on each environment tick
+        self._move: Optional[Tuple[float, float, Location, Location, float]] = None
+        self._move_progress = 0.0
+        self._move_done = threading.Event()
+        # Serializes the tick thread with move_global and stop_service, which
+        # can end a move from the request thread
+        self._move_lock = threading.Lock()
+
+        # Start the drone; its updates are driven by the environment loop
         self.start_service()
 
     # Implement ABC methods
     def update(self) -> None:
         """Update drone state based on elapsed time."""
-        current_time = time.time()
-        # elapsed_time = current_time - self._last_update_time
+        current_time = time.monotonic()
         self._last_update_time = current_time
 
+        with self._move_lock:
+            move = self._move
+            if move is None:
+                return
+
+            start_time, end_time, start, target, fuel_required = move
+            if current_time >= end_time:
+                self._finish_move()
+                return
+            if (
+                self.drone.fuel_level <= 0
+                or self.drone.telemetry.state != DroneState.FLYING
+            ):
+                self._finish_move(completed=False)
+                return
+
+            # Interpolate the position from the clock and burn the matching fuel
+            progress = (current_time - start_time) / (end_time - start_time)
+            self.drone.telemetry.position = Location.model_construct(
+                x=start.x + (target.x - start.x) * progress,
+                y=start.y + (target.y - start.y) * progress,
+                z=start.z + (target.z - start.z) * progress,
+            )
+            self.drone.fuel_level -= fuel_required * (progress - self._move_progress)
+            self._move_progress = progress
+
+    def _finish_move(self, completed: bool = True) -> None:
+        """
+        End the active move and release the waiting caller.
+
+        A completed move settles on its target; an interrupted one stays at
+        the last interpolated position. The caller must hold _move_lock.
+        """
+        move = self._move
+        if move is None:
+            return
+
+        self._move = None
+        if completed:
+            _, _, _, target, fuel_required = move
+            # Burn the fuel left over from the last interpolated tick
+            self.drone.fuel_level -= fuel_required * (1.0 - self._move_progress)
+            # Ensure we reach exactly the target location
+            self.drone.telemetry.position = target
+        self._move_done.set()
+
     def start_service(self) -> None:
-        """Start the drone update thread."""
+        """
+        Start the drone.
+
+        Simulated drones have no thread of their own; the environment
+        simulation loop updates every running one on each tick.
+        """
         if self._is_running:
-            logger.warning(f"Drone {self.drone.drone_id} thread is already running")
+            logger.warning(f"Drone {self.drone.drone_id} is already running")
             return
 
-        self._stop_event.clear()
-        self._drone_thread = threading.Thread(target=self._drone_loop, daemon=True)
-        self._drone_thread.start()
         self._is_running = True
-        logger.info(f"Drone {self.drone.drone_id} thread started")
+        logger.info(f"Drone {self.drone.drone_id} started")
 
     def stop_service(self) -> None:
-        """Stop the drone update thread."""
+        """Stop the drone so the environment loop no longer updates it."""
         if not self._is_running:
-            logger.warning(f"Drone {self.drone.drone_id} thread is not running")
+            logger.warning(f"Drone {self.drone.drone_id} is not running")
             return
 
-        self._stop_event.set()
-        if self._drone_thread:
-            self._drone_thread.join(timeout=2.0)
         self._is_running = False
-        logger.info(f"Drone {self.drone.drone_id} thread stopped")
+        with self._move_lock:
+            self._finish_move(completed=False)
+        logger.info(f"Drone {self.drone.drone_id} stopped")
 
     def take_off(self) -> None:
         """Command drone to take off to specified altitude."""
         target_altitude = CRAZYFLIE_TAKEOFF_ALTITUDE
 
         # Check if drone can take off
-        if self.drone.telemetry.state not in [DroneState.IDLE]:
+        if self.drone.telemetry.state != DroneState.IDLE:
             raise DroneNotOperationalException(
                 f"Cannot take off in {self.drone.telemetry.state} state"
             )
@@ -87,8 +151,10 @@ class SimulationDroneService(DroneServiceBase):
         # Calculate fuel required for takeoff
         estimated_time_minutes = takeoff_time / 60
         fuel_required = (
-            estimated_time_minutes * self.drone.model.fuel_consumption_rate * 1.2
-        )  # 20% more during takeoff
+            estimated_time_minutes
+            * self.drone.model.fuel_consumption_rate
+            * _TAKEOFF_FUEL_FACTOR
+        )
 
         if self.drone.fuel_level < fuel_required:
             raise InsufficientFuelException(
@@ -105,10 +171,29 @@ class SimulationDroneService(DroneServiceBase):
         if num_steps < 1:
             num_steps = 1  # Ensure at least one step
 
-        # Calculate step size for altitude
+        # Calculate step size for altitude and the fuel burnt per step
         dz = altitude_difference / num_steps
+        step_fuel_consumption = (
+            (update_interval / 60)
+            * self.drone.model.fuel_consumption_rate
+            * _TAKEOFF_FUEL_FACTOR
+        )
 
         try:
+            # The vertical path stays inside the boundary box if its end point
+            # does, so validate the target once instead of every step
+            self.environment.validate_location(
+                Telemetry(
+                    position=Location.model_construct(
+                        x=self.drone.telemetry.position.x,
+                        y=self.drone.telemetry.position.y,
+                        z=target_altitude,
+                    ),
+                    heading=self.drone.telemetry.heading,
+                    state=self.drone.telemetry.state,
+                )
+            )
+
             # Move the drone step by step
             for step in range(num_steps):
                 if (
@@ -121,7 +206,7 @@ class SimulationDroneService(DroneServiceBase):
                 new_z = self.drone.telemetry.position.z + dz
 
                 # Update drone location
-                new_location = Location(
+                new_location = Location.model_construct(
                     x=self.drone.telemetry.position.x,
                     y=self.drone.telemetry.position.y,
                     z=new_z,
@@ -133,23 +218,16 @@ class SimulationDroneService(DroneServiceBase):
                     state=self.drone.telemetry.state,
                 )
 
-                # Validate the new location
-                self.environment.validate_location(new_telemetry)
                 self.drone.telemetry = new_telemetry
 
                 # Consume fuel for this step
-                step_fuel_consumption = (
-                    (update_interval / 60)
-                    * self.drone.model.fuel_consumption_rate
-                    * 1.2
-                )  # 20% more during takeoff
                 self.drone.fuel_level -= step_fuel_consumption
 
                 # Sleep for the update interval
                 time.sleep(update_interval)
 
             # Ensure we reach exactly the target altitude
-            final_location = Location(
+            final_location = Location.model_construct(
                 x=self.drone.telemetry.position.x,
                 y=self.drone.telemetry.position.y,
                 z=target_altitude,
@@ -159,7 +237,6 @@ class SimulationDroneService(DroneServiceBase):
                 heading=self.drone.telemetry.heading,
                 state=self.drone.telemetry.state,
             )
-            self.environment.validate_location(final_telemetry)
             self.drone.telemetry = final_telemetry
 
             # Change state to flying and reset speed
@@ -176,7 +253,7 @@ class SimulationDroneService(DroneServiceBase):
         """Command drone to land."""
         target_altitude = 0.1  # Final altitude after landing
 
-        if self.drone.telemetry.state not in [DroneState.FLYING, DroneState.EMERGENCY]:
+        if self.drone.telemetry.state not in _LANDABLE_STATES:
             raise DroneNotOperationalException(
                 f"Cannot land in {self.drone.telemetry.state} state"
             )
@@ -190,8 +267,10 @@ class SimulationDroneService(DroneServiceBase):
         # Calculate fuel required for landing
         estimated_time_minutes = landing_time / 60
         fuel_required = (
-            estimated_time_minutes * self.drone.model.fuel_consumption_rate * 1.1
-        )  # 10% more during landing
+            estimated_time_minutes
+            * self.drone.model.fuel_consumption_rate
+            * _LANDING_FUEL_FACTOR
+        )
 
         if self.drone.fuel_level < fuel_required:
             # If not enough fuel, enter emergency state but still try to land
@@ -213,23 +292,39 @@ class SimulationDroneService(DroneServiceBase):
         if num_steps < 1:
             num_steps = 1  # Ensure at least one step
 
-        # Calculate step size for altitude (negative for descent)
+        # Calculate step size for altitude (negative for descent) and fuel per step
         dz = -altitude_difference / num_steps
+        step_fuel_consumption = (
+            (update_interval / 60)
+            * self.drone.model.fuel_consumption_rate
+            * _LANDING_FUEL_FACTOR
+        )
 
         try:
+            # The vertical path stays inside the boundary box if its end point
+            # does, so validate the target once instead of every step
+            self.environment.validate_location(
+                Telemetry(
+                    position=Location.model_construct(
+                        x=self.drone.telemetry.position.x,
+                        y=self.drone.telemetry.position.y,
+                        z=target_altitude,
+                    ),
+                    heading=self.drone.telemetry.heading,
+                    state=self.drone.telemetry.state,
+                )
+            )
+
             # Move the drone step by step
             for step in range(num_steps):
-                if self.drone.telemetry.state not in [
-                    DroneState.LANDING,
-                    DroneState.EMERGENCY,
-                ]:
+                if self.drone.telemetry.state not in _LANDING_STATES:
                     break
 
                 # Calculate new position
                 new_z = max(target_altitude, self.drone.telemetry.position.z + dz)
 
                 # Update drone location
-                new_location = Location(
+                new_location = Location.model_construct(
                     x=self.drone.telemetry.position.x,
                     y=self.drone.telemetry.position.y,
                     z=new_z,
@@ -241,17 +336,10 @@ class SimulationDroneService(DroneServiceBase):
                     state=self.drone.telemetry.state,
                 )
 
-                # Validate the new location
-                self.environment.validate_location(new_telemetry)
                 self.drone.telemetry = new_telemetry
 
                 # Consume fuel for this step
                 if self.drone.fuel_level > 0:
-                    step_fuel_consumption = (
-                        (update_interval / 60)
-                        * self.drone.model.fuel_consumption_rate
-                        * 1.1
-                    )  # 10% more during landing
                     self.drone.fuel_level = max(
                         0, self.drone.fuel_level - step_fuel_consumption
                     )
@@ -260,7 +348,7 @@ class SimulationDroneService(DroneServiceBase):
                 time.sleep(update_interval)
 
             # Ensure we reach exactly the target altitude
-            final_location = Location(
+            final_location = Location.model_construct(
                 x=self.drone.telemetry.position.x,
                 y=self.drone.telemetry.position.y,
                 z=target_altitude,
@@ -270,7 +358,6 @@ class SimulationDroneService(DroneServiceBase):
                 heading=self.drone.telemetry.heading,
                 state=self.drone.telemetry.state,
             )
-            self.environment.validate_location(final_telemetry)
             self.drone.telemetry = final_telemetry
 
             # Change state to idle and reset speed
@@ -299,10 +386,10 @@ class SimulationDroneService(DroneServiceBase):
         self.environment.validate_location(target_telemetry)
 
         # Calculate distance to move
-        distance = math.sqrt(
-            (target_location.x - self.drone.telemetry.position.x) ** 2
-            + (target_location.y - self.drone.telemetry.position.y) ** 2
-            + (target_location.z - self.drone.telemetry.position.z) ** 2
+        distance = math.hypot(
+            target_location.x - self.drone.telemetry.position.x,
+            target_location.y - self.drone.telemetry.position.y,
+            target_location.z - self.drone.telemetry.position.z,
         )
 
         # Calculate time to reach destination based on max speed
@@ -317,42 +404,23 @@ class SimulationDroneService(DroneServiceBase):
                 f"Insufficient fuel for move: required {fuel_required}, available {self.drone.fuel_level}"
             )
 
-        # Calculate the number of steps based on a reasonable update interval (e.g., 0.1 seconds)
-        update_interval = 0.1  # seconds
-        num_steps = int(travel_time / update_interval)
-
-        if num_steps < 1:
-            num_steps = 1  # Ensure at least one step
-
-        # Calculate step sizes for each coordinate
-        dx = (target_location.x - self.drone.telemetry.position.x) / num_steps
-        dy = (target_location.y - self.drone.telemetry.position.y) / num_steps
-        dz = (target_location.z - self.drone.telemetry.position.z) / num_steps
-
-        # Move the drone step by step
-        for step in range(num_steps):
-            if (
-                self.drone.fuel_level <= 0
-                or self.drone.telemetry.state != DroneState.FLYING
-            ):
-                break
-
-            # Update drone location
-            self.drone.telemetry.position.x = self.drone.telemetry.position.x + dx
-            self.drone.telemetry.position.y = self.drone.telemetry.position.y + dy
-            self.drone.telemetry.position.z = self.drone.telemetry.position.z + dz
-
-            # Consume fuel for this step
-            step_fuel_consumption = (
-                update_interval / 60
-            ) * self.drone.model.fuel_consumption_rate
-            self.drone.fuel_level -= step_fuel_consumption
-
-            # Sleep for the update interval
-            time.sleep(update_interval)
-
-        # Ensure we reach exactly the target location
-        self.drone.telemetry.position = target_location
+        # Hand the move to the environment loop, which interpolates the
+        # position on each tick, and wait until it settles on the target
+        start_time = time.monotonic()
+        with self._move_lock:
+            self._move_progress = 0.0
+            self._move_done.clear()
+            self._move = (
+                start_time,
+                start_time + travel_time,
+                self.drone.telemetry.position,
+                target_location,
+                fuel_required,
+            )
+        if not self._move_done.wait(travel_time + 1.0):
+            # The environment loop is not running; settle the move here
+            with self._move_lock:
+                self._finish_move()
 
     def turn_global(self, heading: float) -> None:
         """Command drone to turn to a target heading angle."""
@@ -398,8 +466,11 @@ class SimulationDroneService(DroneServiceBase):
         if num_steps < 1:
             num_steps = 1  # Ensure at least one step
 
-        # Calculate step size for heading change
+        # Calculate step size for heading change and the fuel burnt per step
         dheading = angle_diff / num_steps
+        step_fuel_consumption = (
+            update_interval / 60
+        ) * self.drone.model.fuel_consumption_rate
 
         try:
             # Turn the drone step by step
@@ -426,9 +497,6 @@ class SimulationDroneService(DroneServiceBase):
                 self.drone.telemetry = new_telemetry
 
                 # Consume fuel for this step
-                step_fuel_consumption = (
-                    update_interval / 60
-                ) * self.drone.model.fuel_consumption_rate
                 self.drone.fuel_level -= step_fuel_consumption
 
                 # Sleep for the update interval
@@ -458,7 +526,7 @@ class SimulationDroneService(DroneServiceBase):
 
     def move_body(self, relative_location: Location) -> None:
         """Command drone to move in the body frame."""
-        target_location = Location(
+        target_location = Location.model_construct(
             x=self.drone.telemetry.position.x + relative_location.x,
             y=self.drone.telemetry.position.y + relative_location.y,
             z=self.drone.telemetry.position.z + relative_location.z,
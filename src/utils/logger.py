@@ -2,18 +2,39 @@
 Logger configuration for the Talking Drone application.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import traceback
 from typing import Any, Dict, Optional
 
+# Maximum number of log records waiting to be written before new ones are dropped
+LOG_QUEUE_MAX_SIZE = 10000
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records when the queue is full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record without blocking, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
 
 def setup_logger():
-    """Configure and return a logger instance."""
-    # Create logger
+    """Configure and return a logger instance and its queue listener."""
+    # Create logger; its level decides which records are built at all, so
+    # isEnabledFor guards skip the work for records that would be dropped
     logger = logging.getLogger("talkingdrone")
-    logger.setLevel(logging.DEBUG)
+    if os.environ.get("DEBUG", "false").lower() == "true":
+        logger.setLevel(logging.DEBUG)
+    else:
+        logger.setLevel(logging.INFO)
 
     # Create formatter
     formatter = logging.Formatter(
@@ -25,19 +46,42 @@ def setup_logger():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
 
-    # Set console level based on environment
-    if os.environ.get("DEBUG", "false").lower() == "true":
-        console_handler.setLevel(logging.DEBUG)
-    else:
-        console_handler.setLevel(logging.INFO)
-
-    logger.addHandler(console_handler)
+    # Route records through a bounded queue; the console handler runs in the
+    # listener thread
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+    logger.addHandler(DroppingQueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
 
-    return logger
+    return logger, listener
 
 
 # Create the singleton logger instance
-logger = setup_logger()
+logger, _log_listener = setup_logger()
+_log_listener_started = False
+
+
+def start_log_listener() -> None:
+    """Start the background thread that writes queued log records."""
+    global _log_listener_started
+    if not _log_listener_started:
+        _log_listener.start()
+        _log_listener_started = True
+
+
+def stop_log_listener() -> None:
+    """Flush queued log records and stop the background writer thread."""
+    global _log_listener_started
+    if _log_listener_started:
+        _log_listener.stop()
+        _log_listener_started = False
+
+
+# Write queued records from the moment the queue handler is installed, in
+# every process that imports the logger, and flush them on exit
+start_log_listener()
+atexit.register(stop_log_listener)
 
 
 def log_endpoint_error(
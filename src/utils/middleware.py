@@ -0,0 +1,75 @@
+"""
+ASGI middleware for the Talking Drone application.
+"""
+
+import logging
+import time
+
+from src.utils.logger import logger
+
+# Static assets and API docs are passed through without timing or logging
+UNLOGGED_PATH_PREFIXES = ("/viz/", "/docs", "/openapi.json", "/redoc")
+
+
+class TimingLogMiddleware:
+    """Pure ASGI middleware that logs API requests and their processing time."""
+
+    __slots__ = ("app",)
+
+    def __init__(self, app):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        """Log information about API requests."""
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        path = scope["path"]
+        if path.startswith(UNLOGGED_PATH_PREFIXES):
+            return await self.app(scope, receive, send)
+
+        # Get request details
+        method = scope["method"]
+        endpoint = f"{method} {path}"
+        # Share the endpoint string with the exception handlers via request.state
+        scope.setdefault("state", {})["endpoint"] = endpoint
+        start_time = time.perf_counter()
+
+        # Skip logging for /environment/state endpoint to reduce noise, and
+        # skip it entirely when INFO records would be discarded anyway
+        should_log = logger.isEnabledFor(logging.INFO) and not (
+            method == "GET" and path == "/environment/state/"
+        )
+
+        # Log the request only if not filtered
+        if should_log:
+            logger.info("REQUEST: %s", endpoint)
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # Process the request
+        await self.app(scope, receive, send_wrapper)
+
+        # Calculate processing time
+        process_time = time.perf_counter() - start_time
+
+        # Log response information only if not filtered
+        if should_log:
+            logger.info(
+                "RESPONSE: %s - Status %d - Took %.3fs",
+                endpoint,
+                status_code,
+                process_time,
+            )
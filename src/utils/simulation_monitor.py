@@ -57,7 +57,7 @@ class SimulationMonitor:
         while not self._stop_event.is_set():
             # Log the current simulation time (but don't update it)
             sim_time = self.environment.time
-            logger.info(f"Simulation time: {sim_time:.2f}s")
+            logger.info("Simulation time: %.2fs", sim_time)
 
             # Sleep for the specified interval
             # Using wait with timeout allows for responsive shutdown
@@ -68,9 +68,11 @@ class SimulationMonitor:
 _simulation_monitor: Optional[SimulationMonitor] = None
 
 
-def get_simulation_monitor(environment: EnvironmentService) -> SimulationMonitor:
+def get_simulation_monitor(
+    environment: EnvironmentService, interval: int = 10
+) -> SimulationMonitor:
     """Get or create the singleton simulation monitor."""
     global _simulation_monitor
     if _simulation_monitor is None:
-        _simulation_monitor = SimulationMonitor(environment)
+        _simulation_monitor = SimulationMonitor(environment, interval)
     return _simulation_monitor
@@ -0,0 +1,89 @@
+import importlib.util
+import sys
+import types
+from typing import Any, List
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import Field
+
+# API keys live in an untracked src/constant/keys.py; none are needed here
+if importlib.util.find_spec("src.constant.keys") is None:
+    keys = types.ModuleType("src.constant.keys")
+    keys.GOOGLE_API_KEY = ""
+    sys.modules["src.constant.keys"] = keys
+
+from src.config.settings import get_settings  # noqa: E402
+from src.models.physical_models import DroneState, Location, Telemetry  # noqa: E402
+from src.services import autopilot_agent  # noqa: E402
+from src.services.environment import EnvironmentService  # noqa: E402
+from src.services.simulation_drone import SimulationDroneService  # noqa: E402
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that records its prompts and echoes the last human message."""
+
+    prompts: List[List[BaseMessage]] = Field(default_factory=list)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "FakeChatModel":
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.prompts.append(messages)
+        command = next(
+            message.content
+            for message in reversed(messages)
+            if isinstance(message, HumanMessage)
+        )
+        reply = AIMessage(content=f"done: {command}")
+        return ChatResult(generations=[ChatGeneration(message=reply)])
+
+
+@pytest.fixture
+def chat_model(monkeypatch) -> FakeChatModel:
+    """Serve every agent graph from a fake chat model."""
+    model = FakeChatModel()
+    monkeypatch.setattr(autopilot_agent, "get_llm_object", lambda model_name: model)
+    monkeypatch.setattr(autopilot_agent, "_GRAPH_CACHE", {})
+    return model
+
+
+@pytest.fixture
+def environment():
+    """Environment whose simulation loop is stopped again after the test."""
+    environment = EnvironmentService()
+    yield environment
+    environment._stop_event.set()
+    environment._time_thread.join()
+
+
+@pytest.fixture
+def drone_service(environment) -> SimulationDroneService:
+    """Simulated drone idling on the ground inside the environment."""
+    return SimulationDroneService.create_drone(
+        model=environment.default_drone_model,
+        telemetry=Telemetry(
+            position=Location(x=0.5, y=0.5, z=0.0), state=DroneState.IDLE
+        ),
+        drone_id="test",
+        environment=environment,
+    )
+
+
+@pytest.fixture
+def settings_env(monkeypatch):
+    """Set TALKINGDRONE_* variables and rebuild the settings around the test."""
+
+    def set_env(**values):
+        for name, value in values.items():
+            monkeypatch.setenv(f"TALKINGDRONE_{name.upper()}", value)
+        get_settings.cache_clear()
+
+    yield set_env
+    get_settings.cache_clear()
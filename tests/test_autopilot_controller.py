@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+
+from src.controller.autopilot import _stream_reply, get_autopilot_service, router
+from src.services.autopilot_service import AutoPilotService
+
+
+def _read(stream) -> str:
+    async def read():
+        return "".join([text async for text in stream])
+
+    return asyncio.run(read())
+
+
+def test_stream_reply_forwards_agent_text_as_events(chat_model, drone_service):
+    autopilot = AutoPilotService(drone_service)
+
+    assert _read(_stream_reply(autopilot, "take off")) == "data: done: take off\n\n"
+
+
+def test_stream_reply_ends_with_error_event_when_command_fails(
+    chat_model, drone_service
+):
+    autopilot = AutoPilotService(drone_service)
+    autopilot.stop()
+
+    reply = _read(_stream_reply(autopilot, "take off"))
+
+    assert reply == "event: error\ndata: Autopilot stopped, command not executed\n\n"
+    assert autopilot.memory == []
+
+
+class _SteppedAutopilot:
+    """Autopilot stub that yields its second chunk only after the first is sent."""
+
+    def __init__(self):
+        self.first_sent = asyncio.Event()
+
+    async def stream_command(self, command):
+        yield "first\n" + "x" * 2048
+        await self.first_sent.wait()
+        yield "second"
+
+
+def test_stream_stays_incremental_with_gzip():
+    autopilot = _SteppedAutopilot()
+    app = FastAPI()
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    app.include_router(router)
+    app.dependency_overrides[get_autopilot_service] = lambda: autopilot
+    body = json.dumps({"command": "take off"}).encode()
+    requests = [{"type": "http.request", "body": body, "more_body": False}]
+    messages = []
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # The client stays connected until the response is complete
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body" and message["body"]:
+            autopilot.first_sent.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/autopilot/test/command/stream/",
+        "raw_path": b"/autopilot/test/command/stream/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"accept-encoding", b"gzip"),
+            (b"content-type", b"application/json"),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    # A buffering middleware would hold the first chunk back and never finish
+    asyncio.run(asyncio.wait_for(app(scope, receive, send), timeout=5))
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-type"].startswith(b"text/event-stream")
+    assert b"content-encoding" not in headers
+    bodies = [
+        message["body"]
+        for message in messages
+        if message["type"] == "http.response.body" and message["body"]
+    ]
+    assert bodies == [
+        b"data: first\ndata: " + b"x" * 2048 + b"\n\n",
+        b"data: second\n\n",
+    ]
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.models import AutopilotException
+from src.services.autopilot_service import AutoPilotService
+
+
+def test_run_batch_sends_each_command_to_the_model(chat_model, drone_service):
+    autopilot = AutoPilotService(drone_service)
+    commands = ["fly to the red building", "turn 90 degrees"]
+
+    results = asyncio.run(autopilot.run_batch(commands))
+
+    assert [result.to_dict() for result in results] == [
+        {"command": command, "status": "success", "result": f"done: {command}"}
+        for command in commands
+    ]
+    assert [prompt[-1].content for prompt in chat_model.prompts] == commands
+    assert autopilot.memory == []
+
+
+def test_run_batch_skips_commands_once_stopped(chat_model, drone_service):
+    autopilot = AutoPilotService(drone_service)
+    autopilot.stop()
+
+    results = asyncio.run(autopilot.run_batch(["take off", "land"]))
+
+    assert [result.status for result in results] == ["error", "error"]
+    assert chat_model.prompts == []
+
+
+def test_prompt_carries_instructions_context_and_history(chat_model, drone_service):
+    autopilot = AutoPilotService(drone_service)
+
+    asyncio.run(autopilot.execute_command("fly to the red building"))
+
+    system, context, command = chat_model.prompts[-1]
+    assert isinstance(system, SystemMessage)
+    assert "## CURRENT STATUS" in context.content
+    assert isinstance(command, HumanMessage)
+    assert command.content == "fly to the red building"
+    assert [message.content for message in autopilot.memory] == [
+        "fly to the red building",
+        "done: fly to the red building",
+    ]
+
+
+def test_submitted_commands_run_one_at_a_time(chat_model, drone_service):
+    autopilot = AutoPilotService(drone_service)
+
+    async def submit_both():
+        return await asyncio.gather(
+            autopilot.submit_command("take off"),
+            autopilot.submit_command("fly to the red building"),
+        )
+
+    replies = asyncio.run(submit_both())
+
+    assert replies == ["done: take off", "done: fly to the red building"]
+    assert [message.content for message in autopilot.memory] == [
+        "take off",
+        "done: take off",
+        "fly to the red building",
+        "done: fly to the red building",
+    ]
+
+
+def test_stop_rejects_waiting_commands(chat_model, drone_service):
+    autopilot = AutoPilotService(drone_service)
+
+    async def submit_and_stop():
+        running = asyncio.create_task(autopilot.submit_command("take off"))
+        waiting = asyncio.create_task(autopilot.submit_command("land"))
+        await asyncio.sleep(0)
+        autopilot.stop()
+        assert await running == "done: take off"
+        with pytest.raises(AutopilotException):
+            await waiting
+        with pytest.raises(AutopilotException):
+            await autopilot.submit_command("take off")
+
+    asyncio.run(asyncio.wait_for(submit_and_stop(), timeout=5))
+
+    assert [message.content for message in autopilot.memory] == [
+        "take off",
+        "done: take off",
+    ]
+
+
+def test_streamed_and_submitted_commands_run_one_at_a_time(chat_model, drone_service):
+    autopilot = AutoPilotService(drone_service)
+
+    async def stream(command):
+        return "".join([text async for text in autopilot.stream_command(command)])
+
+    async def stream_and_submit():
+        return await asyncio.gather(
+            stream("take off"), autopilot.submit_command("land")
+        )
+
+    streamed, _ = asyncio.run(stream_and_submit())
+
+    assert streamed == "done: take off"
+    assert [message.content for message in autopilot.memory] == [
+        "take off",
+        "done: take off",
+        "land",
+        "done: land",
+    ]
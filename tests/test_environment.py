@@ -0,0 +1,16 @@
+import orjson
+
+
+def test_state_json_lists_a_drone_added_within_the_same_tick(
+    environment, drone_service
+):
+    environment._stop_event.set()
+    environment._time_thread.join()
+    assert orjson.loads(environment.get_state_json())["drones"] == {}
+
+    environment.drones["test"] = drone_service
+    environment.invalidate_state()
+
+    state = orjson.loads(environment.get_state_json())
+    assert state["drones"]["test"]["drone_id"] == "test"
+    assert state["environment"]["features"]["boundaries"] == [1.35, 1.25, 1.25]
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+
+import pytest
+
+from src.utils.logger import logger
+from src.utils.middleware import TimingLogMiddleware
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 204, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def _request(method: str, path: str) -> dict:
+    scope = {"type": "http", "method": method, "path": path}
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        pass
+
+    asyncio.run(TimingLogMiddleware(_app)(scope, receive, send))
+    return scope
+
+
+@pytest.fixture
+def logger_level():
+    level = logger.level
+    yield logger.setLevel
+    logger.setLevel(level)
+
+
+def test_logs_request_and_response(caplog, logger_level):
+    logger_level(logging.INFO)
+    scope = _request("POST", "/drone/")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0] == "REQUEST: POST /drone/"
+    assert messages[1].startswith("RESPONSE: POST /drone/ - Status 204")
+    assert scope["state"]["endpoint"] == "POST /drone/"
+
+
+def test_skips_logging_when_info_is_disabled(caplog, logger_level):
+    logger_level(logging.WARNING)
+    _request("POST", "/drone/")
+
+    assert not caplog.records
+
+
+def test_skips_logging_for_state_polls(caplog, logger_level):
+    logger_level(logging.INFO)
+    _request("GET", "/environment/state/")
+
+    assert not caplog.records
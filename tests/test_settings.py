@@ -0,0 +1,23 @@
+from src.config.settings import get_settings
+
+
+def test_settings_read_prefixed_environment_variables(settings_env):
+    settings_env(
+        app_name="Test Drone",
+        boundaries="[2.0, 2.0, 1.0]",
+        langchain_light_model="google_genai:gemini-2.5-flash",
+    )
+
+    settings = get_settings()
+
+    assert settings.app_name == "Test Drone"
+    assert settings.boundaries == (2.0, 2.0, 1.0)
+    assert settings.langchain_light_model == "google_genai:gemini-2.5-flash"
+    assert get_settings() is settings
+
+
+def test_settings_ignore_unprefixed_environment_variables(settings_env, monkeypatch):
+    monkeypatch.setenv("APP_NAME", "Other Drone")
+    settings_env()
+
+    assert get_settings().app_name == "The Talking Drone"
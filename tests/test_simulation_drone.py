@@ -0,0 +1,79 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.models.physical_models import DroneState, Location
+from src.services import simulation_drone
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the simulated drone's monotonic clock by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(
+        simulation_drone,
+        "time",
+        SimpleNamespace(monotonic=lambda: now[0], sleep=time.sleep),
+    )
+    return now
+
+
+@pytest.fixture
+def flying_drone(drone_service):
+    drone_service.drone.telemetry.state = DroneState.FLYING
+    drone_service.drone.telemetry.position = Location(x=0.5, y=0.5, z=0.5)
+    return drone_service
+
+
+def _start_move(drone_service, target: Location) -> threading.Thread:
+    mover = threading.Thread(target=drone_service.move_global, args=(target,))
+    mover.start()
+    deadline = time.monotonic() + 1.0
+    while drone_service._move is None and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert drone_service._move is not None
+    return mover
+
+
+def test_move_global_is_advanced_by_update(clock, flying_drone):
+    fuel_level = flying_drone.drone.fuel_level
+    # 0.2 m at 0.2 m/s takes one second and burns 1/60 of the fuel rate
+    target = Location(x=0.5, y=0.5, z=0.7)
+    mover = _start_move(flying_drone, target)
+
+    clock[0] += 0.5
+    flying_drone.update()
+
+    position = flying_drone.drone.telemetry.position
+    assert position.z == pytest.approx(0.6)
+    assert flying_drone.drone.fuel_level == pytest.approx(fuel_level - 1 / 120)
+    assert mover.is_alive()
+
+    clock[0] += 0.5
+    flying_drone.update()
+    mover.join(timeout=1.0)
+
+    assert not mover.is_alive()
+    assert flying_drone.drone.telemetry.position == target
+    assert flying_drone.drone.fuel_level == pytest.approx(fuel_level - 1 / 60)
+
+
+def test_stop_service_freezes_a_running_move(clock, flying_drone):
+    fuel_level = flying_drone.drone.fuel_level
+    mover = _start_move(flying_drone, Location(x=0.5, y=0.5, z=0.7))
+
+    clock[0] += 0.25
+    flying_drone.update()
+    flying_drone.stop_service()
+    mover.join(timeout=1.0)
+
+    assert not mover.is_alive()
+    assert flying_drone.drone.telemetry.position.z == pytest.approx(0.55)
+    assert flying_drone.drone.fuel_level == pytest.approx(fuel_level - 1 / 240)
+
+    # A late tick no longer moves the stopped drone
+    clock[0] += 0.75
+    flying_drone.update()
+    assert flying_drone.drone.telemetry.position.z == pytest.approx(0.55)